@@ -2,15 +2,17 @@
 
 import argparse
 import asyncio
+import io
 import os
 import sys
 
 from dotenv import load_dotenv
 
-from src.tfsp.audio import AudioPlayer
+from src.tfsp.audio import AudioPlayer, PlayerWorker
 from src.tfsp.buffer import TokenBuffer
 from src.tfsp.encoders import DTMFEncoder, FSKEncoder, UltrasonicEncoder
 from src.tfsp.providers import AnthropicProvider, OpenAIProvider
+from src.tfsp.runtime import fast_loop_factory
 
 load_dotenv()
 
@@ -52,25 +54,26 @@ async def run_stream(args: argparse.Namespace) -> None:
         await run_tts(args, provider)
         return
 
-    # Initialize audio
+    # Initialize audio; playback runs on a worker thread so streaming never stalls
     player = AudioPlayer()
+    worker = PlayerWorker(player)
 
     # Callback for when buffer flushes
     async def on_buffer_flush(text: str) -> None:
         if args.verbose:
             print(f"\n[ENCODE] '{text}'")
-
-        frame = encoder.encode(text)
-
-        if args.verbose:
+            frame = encoder.encode(text)
             for tone in frame.tones:
                 freqs = ", ".join(f"{f:.0f}Hz" for f in tone.frequencies)
                 print(f"  → [{freqs}] {tone.duration_ms}ms")
 
-        player.play_tones(frame.tones)
+        # One pre-rendered buffer per flush instead of one playback per tone
+        worker.submit(encoder.encode_pcm(text))
 
-    # Initialize buffer
+    # Initialize buffer; with one token per flush it would only add overhead,
+    # so chunks go straight to the flush callback instead
     buffer = TokenBuffer(args.buffer_tokens, on_buffer_flush)
+    handle_chunk = on_buffer_flush if args.buffer_tokens == 1 else buffer.add
 
     # Stream and process
     print(f"Streaming from {provider.__class__.__name__} using {encoding_name}...")
@@ -79,10 +82,13 @@ async def run_stream(args: argparse.Namespace) -> None:
 
     async for chunk in provider.stream(args.prompt):
         print(chunk, end="", flush=True)
-        await buffer.add(chunk)
+        await handle_chunk(chunk)
 
-    # Flush any remaining
+    # Flush any remaining, then let queued audio finish
     await buffer.flush()
+    await worker.drain()
+    worker.close()
+    player.close()
 
     print()
     print("-" * 40)
@@ -98,18 +104,18 @@ async def run_tts(args: argparse.Namespace, provider) -> None:
         print("Error: ELEVENLABS_API_KEY environment variable not set", file=sys.stderr)
         sys.exit(1)
 
-    tts = ElevenLabsTTS(api_key=api_key)
+    tts = ElevenLabsTTS(api_key=api_key, cache_dir=args.tts_cache)
 
     print(f"Streaming from {provider.__class__.__name__}...")
     print("-" * 40)
 
     # Collect full response
-    chunks = []
+    buf = io.StringIO()
     async for chunk in provider.stream(args.prompt):
         print(chunk, end="", flush=True)
-        chunks.append(chunk)
+        buf.write(chunk)
 
-    full_text = "".join(chunks)
+    full_text = buf.getvalue()
     print()
     print("-" * 40)
 
@@ -238,6 +244,13 @@ Examples:
         default=None,
         help="Specific model to use (default: gpt-4o-mini / claude-sonnet-4-5-20250929)",
     )
+    parser.add_argument(
+        "--tts-cache",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help="Cache synthesized TTS audio in DIR and reuse it for repeated text",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -282,7 +295,7 @@ Examples:
     if not any([args.dtmf, args.fsk, args.ultrasonic, args.tts]):
         parser.error("--dtmf, --fsk, --ultrasonic, or --tts is required")
 
-    asyncio.run(run_stream(args))
+    asyncio.run(run_stream(args), loop_factory=fast_loop_factory())
 
 
 if __name__ == "__main__":
@@ -1,7 +1,14 @@
 """Audio generation and playback."""
 
-from .tone import generate_tone
+from .tone import generate_tone, synthesize_frame, to_pcm16
 from .player import AudioPlayer
+from .worker import PlayerWorker
 
-__all__ = ["generate_tone", "AudioPlayer"]
+__all__ = [
+    "generate_tone",
+    "synthesize_frame",
+    "to_pcm16",
+    "AudioPlayer",
+    "PlayerWorker",
+]
 
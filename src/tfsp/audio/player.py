@@ -1,33 +1,142 @@
+import threading
+
 import numpy as np
-import sounddevice as sd
 
-from ..encoders.base import ToneEvent
-from .tone import generate_tone
+from ..encoders.base import EncodedFrame, ToneEvent
+from .tone import generate_tone, synthesize_frame, to_pcm16
 
 
 class AudioPlayer:
     """Plays audio through system speakers."""
 
-    def __init__(self, sample_rate: int = 44100):
+    def __init__(
+        self,
+        sample_rate: int = 44100,
+        buffer_ms: int = 200,
+        blocksize: int = 512,
+    ):
         """
         Initialize audio player.
 
+        Samples are written as 16-bit PCM into a ring buffer that a
+        persistent output stream drains from its audio callback, so callers
+        only block when the ring is full (or when they explicitly wait for
+        playback).
+
         Args:
             sample_rate: Audio sample rate (default: 44100)
+            buffer_ms: Ring buffer size in milliseconds (default: 200)
+            blocksize: Frames per audio callback (default: 512)
         """
+        # Imported here so encoders and synthesis work without PortAudio
+        import sounddevice as sd
+
         self.sample_rate = sample_rate
+        self._ring = np.zeros(int(sample_rate * buffer_ms / 1000), dtype=np.int16)
+        # Monotonic sample counters; position in the ring is counter % size
+        self._read_idx = 0
+        self._write_idx = 0
+        self._cond = threading.Condition(threading.Lock())
+        self._stream = sd.OutputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype="int16",
+            callback=self._callback,
+            blocksize=blocksize,
+        )
+        # Open the device now (it plays silence until samples arrive) so the
+        # first real tone doesn't pay PortAudio's startup latency
+        self._stream.start()
+
+    def _callback(self, outdata: np.ndarray, frames: int, time, status) -> None:
+        """Drain queued samples into the output stream, padding with silence."""
+        out = outdata[:, 0]
+        size = len(self._ring)
+        with self._cond:
+            count = min(frames, self._write_idx - self._read_idx)
+            start = self._read_idx % size
+            first = min(count, size - start)
+            out[:first] = self._ring[start : start + first]
+            out[first:count] = self._ring[: count - first]
+            self._read_idx += count
+            self._cond.notify_all()
+        out[count:] = 0
 
     def play(self, samples: np.ndarray, blocking: bool = True) -> None:
         """
         Play audio samples.
 
         Args:
-            samples: Audio samples to play (float32, -1 to 1)
-            blocking: If True, wait for playback to complete
+            samples: Audio samples to play (int16 PCM, or float32 in -1 to 1)
+            blocking: If True, wait until every sample has been handed to the
+                device (the device may still be playing the last block)
         """
-        sd.play(samples, self.sample_rate)
+        if samples.dtype != np.int16:
+            samples = to_pcm16(samples)
+
+        size = len(self._ring)
+        offset = 0
+        while offset < len(samples):
+            with self._cond:
+                self._cond.wait_for(lambda: self._write_idx - self._read_idx < size)
+                free = size - (self._write_idx - self._read_idx)
+                count = min(free, len(samples) - offset)
+                start = self._write_idx % size
+                first = min(count, size - start)
+                self._ring[start : start + first] = samples[offset : offset + first]
+                self._ring[: count - first] = samples[offset + first : offset + count]
+                self._write_idx += count
+            offset += count
+
         if blocking:
-            sd.wait()
+            self.wait()
+
+    def wait(self) -> None:
+        """
+        Block until all queued samples have been handed to the device.
+
+        The device may still be playing the last block when this returns;
+        close() waits for that too.
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._read_idx == self._write_idx)
+
+    def close(self) -> None:
+        """Play out everything already queued, then close the output stream."""
+        self.wait()
+        # stop() lets the device finish its pending buffers; close() alone
+        # would discard them
+        self._stream.stop()
+        self._stream.close()
+
+    def play_samples_concat(self, tones: list[ToneEvent], blocking: bool = True) -> None:
+        """
+        Render a sequence of tones into one buffer and play it in one go.
+
+        Args:
+            tones: List of ToneEvent objects to play
+            blocking: If True, wait for playback to complete
+        """
+        if not tones:
+            return
+        samples = np.concatenate(
+            [
+                generate_tone(tone.frequencies, tone.duration_ms, self.sample_rate)
+                for tone in tones
+            ]
+        )
+        self.play(samples, blocking)
+
+    def play_frame(self, frame: EncodedFrame, blocking: bool = True) -> None:
+        """
+        Synthesize an encoded frame in one pass and play it.
+
+        Args:
+            frame: EncodedFrame to play
+            blocking: If True, wait for playback to complete
+        """
+        samples = synthesize_frame(frame.freqs, frame.durations_ms, self.sample_rate)
+        self.play(samples, blocking)
 
     def play_tones(self, tones: list[ToneEvent]) -> None:
         """
@@ -36,11 +145,4 @@ class AudioPlayer:
         Args:
             tones: List of ToneEvent objects to play
         """
-        for tone in tones:
-            samples = generate_tone(
-                tone.frequencies,
-                tone.duration_ms,
-                self.sample_rate,
-            )
-            self.play(samples)
-
+        self.play_samples_concat(tones)
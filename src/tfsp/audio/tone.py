@@ -1,8 +1,27 @@
+import functools
+from collections.abc import Sequence
+
 import numpy as np
 
+TWO_PI = np.float32(2 * np.pi)
+
+# Full-scale value for 16-bit PCM output
+PCM16_SCALE = 32767
+
+
+@functools.lru_cache(maxsize=8)
+def _fade_ramps(sample_rate: int, fade_ms: int = 10) -> tuple[np.ndarray, np.ndarray]:
+    """Shared, read-only fade-in/fade-out ramps for a sample rate."""
+    fade_samples = int(sample_rate * fade_ms / 1000)
+    fade_in = np.linspace(0, 1, fade_samples, dtype=np.float32)
+    fade_out = np.linspace(1, 0, fade_samples, dtype=np.float32)
+    fade_in.flags.writeable = False
+    fade_out.flags.writeable = False
+    return fade_in, fade_out
+
 
 def generate_tone(
-    frequencies: list[float],
+    frequencies: Sequence[float] | np.ndarray,
     duration_ms: int,
     sample_rate: int = 44100,
 ) -> np.ndarray:
@@ -10,7 +29,7 @@ def generate_tone(
     Generate audio samples for one or more simultaneous frequencies.
 
     Args:
-        frequencies: List of frequencies in Hz
+        frequencies: Frequencies in Hz
         duration_ms: Duration in milliseconds
         sample_rate: Audio sample rate (default: 44100)
 
@@ -18,24 +37,84 @@ def generate_tone(
         numpy array of audio samples (float32, -1 to 1)
     """
     num_samples = int(sample_rate * duration_ms / 1000)
-    t = np.linspace(0, duration_ms / 1000, num_samples, dtype=np.float32)
-
-    # Sum all frequencies (for DTMF dual-tone)
-    signal = np.zeros_like(t)
-    for freq in frequencies:
-        signal += np.sin(2 * np.pi * freq * t)
+    t = np.arange(num_samples, dtype=np.float32) / np.float32(sample_rate)
 
-    # Normalize by number of frequencies to prevent clipping
-    if len(frequencies) > 0:
-        signal = signal / len(frequencies)
+    # Sum all frequencies (for DTMF dual-tone) with one outer-product sin call,
+    # normalized by number of frequencies to prevent clipping. Everything
+    # stays float32 so no widening or final conversion copy is needed.
+    freqs = np.asarray(frequencies, dtype=np.float32)
+    if len(freqs) > 0:
+        phases = (TWO_PI * freqs)[:, None] * t[None, :]
+        signal = np.sin(phases, out=phases).sum(axis=0)
+        signal /= np.float32(len(freqs))
+    else:
+        signal = np.zeros_like(t)
 
     # Apply envelope to avoid clicks (10ms fade in/out)
-    fade_samples = int(sample_rate * 0.01)
+    fade_in, fade_out = _fade_ramps(sample_rate)
+    fade_samples = len(fade_in)
     if fade_samples > 0 and len(signal) > 2 * fade_samples:
-        fade_in = np.linspace(0, 1, fade_samples, dtype=np.float32)
-        fade_out = np.linspace(1, 0, fade_samples, dtype=np.float32)
         signal[:fade_samples] *= fade_in
         signal[-fade_samples:] *= fade_out
 
-    return signal.astype(np.float32)
+    return signal
+
+
+def to_pcm16(samples: np.ndarray) -> np.ndarray:
+    """
+    Quantize float samples to 16-bit PCM.
+
+    The output device is 16-bit anyway, so this halves the size of stored
+    and streamed audio without losing anything audible. Out-of-range input
+    is clipped to full scale rather than wrapping around.
+
+    Args:
+        samples: Audio samples (float32, -1 to 1)
+
+    Returns:
+        numpy array of int16 samples
+    """
+    scaled = np.multiply(samples, PCM16_SCALE, dtype=np.float32)
+    np.clip(scaled, -PCM16_SCALE, PCM16_SCALE, out=scaled)
+    return scaled.astype(np.int16)
+
+
+@functools.cache
+def _numba_synthesize_frame():
+    """Numba frame renderer (None without numba), compiled on first use."""
+    from .tone_numba import synthesize_frame
+
+    return synthesize_frame
+
+
+def synthesize_frame(
+    freqs: np.ndarray,
+    durations_ms: np.ndarray,
+    sample_rate: int = 44100,
+) -> np.ndarray:
+    """
+    Render a whole frame of tones into one buffer.
+
+    Uses the Numba kernel when numba is installed, otherwise concatenates
+    generate_tone output for each tone.
+
+    Args:
+        freqs: Frequencies in Hz, shape (num_tones, max_voices), NaN-padded
+        durations_ms: Duration of each tone in milliseconds
+        sample_rate: Audio sample rate (default: 44100)
+
+    Returns:
+        numpy array of audio samples (float32, -1 to 1)
+    """
+    synthesize_numba = _numba_synthesize_frame()
+    if synthesize_numba is not None:
+        fade_in, fade_out = _fade_ramps(sample_rate)
+        return synthesize_numba(freqs, durations_ms, sample_rate, fade_in, fade_out)
 
+    buffers = [
+        generate_tone(row[~np.isnan(row)], duration_ms, sample_rate)
+        for row, duration_ms in zip(freqs, durations_ms)
+    ]
+    if not buffers:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(buffers)
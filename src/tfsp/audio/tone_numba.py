@@ -0,0 +1,79 @@
+"""Numba-compiled whole-frame tone synthesis.
+
+Numba is optional: when it is not installed ``synthesize_frame`` is None and
+callers fall back to the NumPy implementation in ``tone.py``.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba not installed
+    njit = None
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _synthesize_kernel(freqs, voices, offsets, sample_rate, fade_in, fade_out, out):
+        two_pi = np.float32(2 * np.pi)
+        fade_samples = len(fade_in)
+        for i in prange(len(offsets) - 1):
+            start = offsets[i]
+            num_samples = offsets[i + 1] - start
+            apply_fade = fade_samples > 0 and num_samples > 2 * fade_samples
+            for j in range(num_samples):
+                t = np.float32(j) / np.float32(sample_rate)
+                value = np.float32(0.0)
+                for v in range(freqs.shape[1]):
+                    value += np.sin(two_pi * freqs[i, v] * t)
+                if voices[i] > 0:
+                    value /= np.float32(voices[i])
+                if apply_fade:
+                    if j < fade_samples:
+                        value *= fade_in[j]
+                    elif j >= num_samples - fade_samples:
+                        value *= fade_out[j - (num_samples - fade_samples)]
+                out[start + j] = value
+
+    def synthesize_frame(
+        freqs: np.ndarray,
+        durations_ms: np.ndarray,
+        sample_rate: int,
+        fade_in: np.ndarray,
+        fade_out: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Render a whole frame of tones into one buffer.
+
+        Args:
+            freqs: Frequencies in Hz, shape (num_tones, max_voices), NaN-padded
+            durations_ms: Duration of each tone in milliseconds
+            sample_rate: Audio sample rate
+            fade_in: Envelope ramp applied to the start of each tone
+            fade_out: Envelope ramp applied to the end of each tone
+
+        Returns:
+            numpy array of audio samples (float32, -1 to 1)
+        """
+        # Unused voices become 0 Hz, which contributes sin(0) = 0 to the sum
+        voices = np.count_nonzero(~np.isnan(freqs), axis=1)
+        freqs = np.nan_to_num(freqs).astype(np.float32)
+
+        lengths = (sample_rate * np.asarray(durations_ms) / 1000).astype(np.int64)
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        out = np.empty(offsets[-1], dtype=np.float32)
+        _synthesize_kernel(freqs, voices, offsets, sample_rate, fade_in, fade_out, out)
+        return out
+
+    # Compile (or load from cache) up front so the first real frame is fast.
+    # Ramps are passed read-only to match the shared ramps from tone.py.
+    _ramp = np.linspace(0, 1, 441, dtype=np.float32)
+    _ramp.flags.writeable = False
+    synthesize_frame(np.array([[440.0]], dtype=np.float32), np.array([1]), 44100, _ramp, _ramp)
+    del _ramp
+
+else:
+    synthesize_frame = None
@@ -0,0 +1,76 @@
+import asyncio
+import queue
+import threading
+
+import numpy as np
+
+from .player import AudioPlayer
+
+
+class PlayerWorker:
+    """
+    Feeds an AudioPlayer from a background thread.
+
+    Submitting audio never blocks the caller, so an asyncio event loop can
+    keep reading LLM tokens while earlier buffers are still playing.
+    """
+
+    def __init__(self, player: AudioPlayer):
+        """
+        Initialize the worker and start its playback thread.
+
+        Args:
+            player: Audio player to write samples to
+        """
+        self.player = player
+        self._queue: queue.Queue[np.ndarray | None] = queue.Queue()
+        # First playback error, re-raised from drain()
+        self._error: Exception | None = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Write queued buffers to the player until the stop sentinel."""
+        while True:
+            samples = self._queue.get()
+            try:
+                if samples is None:
+                    return
+                self.player.play(samples, blocking=False)
+            except Exception as error:
+                # Keep consuming so drain() and close() never hang
+                if self._error is None:
+                    self._error = error
+            finally:
+                self._queue.task_done()
+
+    def submit(self, samples: np.ndarray) -> None:
+        """
+        Queue audio samples for playback without blocking.
+
+        Args:
+            samples: Audio samples to play (int16 PCM, or float32 in -1 to 1)
+        """
+        self._queue.put(samples)
+
+    def _drain(self) -> None:
+        """
+        Block until every submitted buffer has been played.
+
+        Raises:
+            Exception: The first error raised by the player since the last drain
+        """
+        self._queue.join()
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+        self.player.wait()
+
+    async def drain(self) -> None:
+        """Wait, without blocking the event loop, until queued audio has played."""
+        await asyncio.to_thread(self._drain)
+
+    def close(self) -> None:
+        """Stop the playback thread once queued audio has been handed off."""
+        self._queue.put(None)
+        self._thread.join()
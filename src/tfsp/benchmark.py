@@ -1,6 +1,7 @@
 """Benchmark script to compare encoding methods and TTS."""
 
 import asyncio
+import io
 import os
 import sys
 import time
@@ -9,6 +10,7 @@ from dataclasses import dataclass
 from .audio import AudioPlayer, generate_tone
 from .encoders import DTMFEncoder, FSKEncoder, UltrasonicEncoder
 from .providers import AnthropicProvider, OpenAIProvider
+from .runtime import fast_loop_factory
 from .tts import ElevenLabsTTS
 
 
@@ -39,7 +41,7 @@ class BenchmarkResult:
 def benchmark_encoder(
     encoder,
     text: str,
-    player: AudioPlayer,
+    player: AudioPlayer | None,
     play_audio: bool = False,
 ) -> BenchmarkResult:
     """
@@ -48,7 +50,7 @@ def benchmark_encoder(
     Args:
         encoder: The encoder to benchmark
         text: Text to encode
-        player: Audio player for playback timing
+        player: Audio player for playback timing (required if play_audio)
         play_audio: Whether to actually play audio (slower but realistic)
 
     Returns:
@@ -62,11 +64,11 @@ def benchmark_encoder(
     # Calculate playback time (or actually play)
     if play_audio:
         start_play = time.perf_counter()
-        player.play_tones(frame.tones)
+        player.play_frame(frame)
         playback_time = (time.perf_counter() - start_play) * 1000
     else:
         # Calculate theoretical playback time
-        playback_time = sum(tone.duration_ms for tone in frame.tones)
+        playback_time = float(frame.durations_ms.sum())
 
     return BenchmarkResult(
         method=encoder.__class__.__name__,
@@ -143,12 +145,12 @@ async def run_benchmark(
             api_key = os.environ.get("ANTHROPIC_API_KEY")
             provider = AnthropicProvider(api_key, "claude-sonnet-4-5-20250929")
 
-        chunks = []
+        buf = io.StringIO()
         async for chunk in provider.stream(prompt):
-            chunks.append(chunk)
+            buf.write(chunk)
             if verbose:
                 print(chunk, end="", flush=True)
-        benchmark_text = "".join(chunks)
+        benchmark_text = buf.getvalue()
         if verbose:
             print("\n")
     else:
@@ -158,8 +160,8 @@ async def run_benchmark(
         print(f"Benchmarking {len(benchmark_text)} characters...")
         print("=" * 60)
 
-    # Initialize components
-    player = AudioPlayer()
+    # Only open an output device when audio is actually played
+    player = AudioPlayer() if play_audio else None
 
     # Benchmark each encoder
     encoders = [
@@ -183,6 +185,9 @@ async def run_benchmark(
         if verbose:
             print(f"{result.chars_per_second:.1f} chars/sec")
 
+    if player is not None:
+        player.close()
+
     # Benchmark TTS if requested
     if include_tts:
         elevenlabs_key = os.environ.get("ELEVENLABS_API_KEY")
@@ -286,7 +291,8 @@ def main() -> None:
             include_tts=not args.no_tts,
             play_audio=args.play,
             verbose=not args.quiet,
-        )
+        ),
+        loop_factory=fast_loop_factory(),
     )
 
     print_benchmark_table(results)
@@ -22,7 +22,7 @@ class TokenBuffer:
         """
         self.buffer_size = buffer_size
         self.on_flush = on_flush
-        self._buffer = ""
+        self._parts: list[str] = []
         self._token_count = 0
 
     async def add(self, text: str) -> None:
@@ -32,7 +32,7 @@ class TokenBuffer:
         Args:
             text: Text chunk to add to buffer
         """
-        self._buffer += text
+        self._parts.append(text)
         self._token_count += 1  # Treating each chunk as a token
 
         if self._token_count >= self.buffer_size:
@@ -40,8 +40,9 @@ class TokenBuffer:
 
     async def flush(self) -> None:
         """Force flush the buffer."""
-        if self._buffer:
-            await self.on_flush(self._buffer)
-            self._buffer = ""
+        if self._parts:
+            text = "".join(self._parts)
+            self._parts.clear()
             self._token_count = 0
+            await self.on_flush(text)
 
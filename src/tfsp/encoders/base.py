@@ -1,31 +1,125 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cached_property
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True, frozen=True, eq=False)
 class ToneEvent:
-    """A single tone or chord to play."""
+    """
+    A single tone or chord to play.
+
+    Compared and hashed by identity, since ``frequencies`` is an array.
+    """
 
-    frequencies: list[float]  # Hz (1 for FSK, 2 for DTMF)
+    frequencies: np.ndarray  # Hz, float32 (1 for FSK, 2 for DTMF)
     duration_ms: int  # How long to play
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class EncodedFrame:
-    """A sequence of tones representing encoded data."""
+    """
+    A sequence of tones representing encoded data.
+
+    Frames are shared through the encoder cache, so they are frozen. They
+    keep a ``__dict__`` (no slots) to hold the lazily built ``tones``, and
+    like ToneEvent are compared and hashed by identity.
 
-    tones: list[ToneEvent]
+    Stored column-wise: row i of ``freqs`` holds the frequencies of tone i
+    (trailing NaN padding when tones have different voice counts) and
+    ``durations_ms[i]`` its duration. Every duration is a whole multiple of
+    ``symbol_duration_ms``; a longer tone is a run of repeated symbols that
+    decoders split back at that granularity.
+    """
+
+    freqs: np.ndarray  # Hz, shape (num_tones, max_voices), float32
+    durations_ms: np.ndarray  # shape (num_tones,)
+    symbol_duration_ms: int  # Duration of a single symbol
     original_text: str  # For debugging/display
 
+    @cached_property
+    def tones(self) -> list[ToneEvent]:
+        """
+        Materialize the frame as ToneEvent objects viewing into ``freqs``.
+
+        Built on first access only, so callers that consume the arrays
+        directly never allocate per-tone objects.
+        """
+        voices = np.count_nonzero(~np.isnan(self.freqs), axis=1).tolist()
+        return [
+            ToneEvent(frequencies=row[:num_voices], duration_ms=duration_ms)
+            for row, num_voices, duration_ms in zip(
+                self.freqs, voices, self.durations_ms.tolist()
+            )
+        ]
+
+
+def text_to_codes(text: str) -> np.ndarray:
+    """
+    Convert text to character codes, clamped to 0-255 for safety.
+
+    Codes are narrowed to uint8 so the table gathers that consume them read
+    one byte per character instead of eight. ASCII text (the common case
+    for LLM output) is already one byte per character and never needs the
+    clamp, so its encoded bytes are used directly.
+    """
+    if text.isascii():
+        return np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    # surrogatepass keeps lone surrogates (e.g. from split emoji) encodable
+    codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    return np.minimum(codes, 255).astype(np.uint8)
+
+
+def uniform_durations(num_tones: int, duration_ms: int) -> np.ndarray:
+    """
+    Durations column for a frame whose tones all last ``duration_ms``.
+
+    Returns a read-only broadcast view of a single value, so uniform frames
+    don't allocate one duration per tone.
+    """
+    return np.broadcast_to(np.int64(duration_ms), (num_tones,))
+
+
+# Maximum number of distinct texts whose frames each encoder keeps cached
+ENCODE_CACHE_SIZE = 2048
+
 
 class BaseEncoder(ABC):
     """Base class for frequency encoders."""
 
-    @abstractmethod
+    def __init__(self):
+        """Initialize the per-encoder frame cache."""
+        self._cache: dict[str, EncodedFrame] = {}
+
     def encode(self, text: str) -> EncodedFrame:
         """
         Encode text into a sequence of tones.
 
+        Streamed LLM output repeats many short chunks (spaces, punctuation,
+        common words), so frames are cached per text. Cached frames are
+        shared, so their arrays are made read-only.
+
+        Args:
+            text: The text to encode
+
+        Returns:
+            EncodedFrame containing the tones to play
+        """
+        frame = self._cache.get(text)
+        if frame is None:
+            frame = self._encode(text)
+            frame.freqs.flags.writeable = False
+            frame.durations_ms.flags.writeable = False
+            if len(self._cache) < ENCODE_CACHE_SIZE:
+                self._cache[text] = frame
+        return frame
+
+    @abstractmethod
+    def _encode(self, text: str) -> EncodedFrame:
+        """
+        Encode text into a sequence of tones, bypassing the cache.
+
         Args:
             text: The text to encode
 
@@ -34,3 +128,15 @@ class BaseEncoder(ABC):
         """
         pass
 
+    @abstractmethod
+    def encode_pcm(self, text: str) -> np.ndarray:
+        """
+        Encode text directly into playable audio samples.
+
+        Args:
+            text: The text to encode
+
+        Returns:
+            numpy array of 16-bit PCM samples (int16) for the whole text
+        """
+        pass
@@ -1,4 +1,7 @@
-from .base import BaseEncoder, EncodedFrame, ToneEvent
+import numpy as np
+
+from ..audio.tone import generate_tone, to_pcm16
+from .base import BaseEncoder, EncodedFrame, text_to_codes, uniform_durations
 
 # DTMF frequency mapping
 # Standard DTMF keypad layout:
@@ -8,70 +11,41 @@ from .base import BaseEncoder, EncodedFrame, ToneEvent
 # 852 Hz    7         8         9         C
 # 941 Hz    *         0         #         D
 
-LOW_FREQUENCIES = {
-    "1": 697,
-    "2": 697,
-    "3": 697,
-    "A": 697,
-    "4": 770,
-    "5": 770,
-    "6": 770,
-    "B": 770,
-    "7": 852,
-    "8": 852,
-    "9": 852,
-    "C": 852,
-    "*": 941,
-    "0": 941,
-    "#": 941,
-    "D": 941,
-}
-
-HIGH_FREQUENCIES = {
-    "1": 1209,
-    "4": 1209,
-    "7": 1209,
-    "*": 1209,
-    "2": 1336,
-    "5": 1336,
-    "8": 1336,
-    "0": 1336,
-    "3": 1477,
-    "6": 1477,
-    "9": 1477,
-    "#": 1477,
-    "A": 1633,
-    "B": 1633,
-    "C": 1633,
-    "D": 1633,
+# (low, high) frequency pair for each DTMF symbol
+SYMBOL_FREQS: dict[str, tuple[float, float]] = {
+    "1": (697.0, 1209.0),
+    "2": (697.0, 1336.0),
+    "3": (697.0, 1477.0),
+    "A": (697.0, 1633.0),
+    "4": (770.0, 1209.0),
+    "5": (770.0, 1336.0),
+    "6": (770.0, 1477.0),
+    "B": (770.0, 1633.0),
+    "7": (852.0, 1209.0),
+    "8": (852.0, 1336.0),
+    "9": (852.0, 1477.0),
+    "C": (852.0, 1633.0),
+    "*": (941.0, 1209.0),
+    "0": (941.0, 1336.0),
+    "#": (941.0, 1477.0),
+    "D": (941.0, 1633.0),
 }
 
-# Map hex digits to DTMF symbols
+# DTMF symbol for each hex digit (nibble value 0-15)
 # 0-9 map directly, A-F map to A-D, *, #
-HEX_TO_DTMF = {
-    "0": "0",
-    "1": "1",
-    "2": "2",
-    "3": "3",
-    "4": "4",
-    "5": "5",
-    "6": "6",
-    "7": "7",
-    "8": "8",
-    "9": "9",
-    "a": "A",
-    "b": "B",
-    "c": "C",
-    "d": "D",
-    "e": "*",
-    "f": "#",
-    "A": "A",
-    "B": "B",
-    "C": "C",
-    "D": "D",
-    "E": "*",
-    "F": "#",
-}
+DTMF_SYMBOLS = "0123456789ABCD*#"
+
+# Frequency pair for each nibble value, shape (16, 2)
+NIBBLE_FREQS = np.array([SYMBOL_FREQS[symbol] for symbol in DTMF_SYMBOLS], dtype=np.float32)
+
+
+def _text_to_nibbles(text: str) -> np.ndarray:
+    """Split the character codes of text into hex digits, high nibble first."""
+    data = text_to_codes(text)
+    nibbles = np.empty(2 * len(data), dtype=np.uint8)
+    nibbles[0::2] = data >> 4
+    nibbles[1::2] = data & 0xF
+    return nibbles
 
 
 class DTMFEncoder(BaseEncoder):
@@ -80,35 +54,39 @@ class DTMFEncoder(BaseEncoder):
 
     Each character is converted to its hex representation (2 digits),
     and each hex digit maps to a DTMF symbol with corresponding
-    low and high frequency pair.
+    low and high frequency pair. Codes above 255 are clamped to 255.
     """
 
-    def __init__(self, tone_duration_ms: int = 100):
+    def __init__(self, tone_duration_ms: int = 100, sample_rate: int = 44100):
         """
         Initialize DTMF encoder.
 
         Args:
             tone_duration_ms: Duration of each tone in milliseconds
+            sample_rate: Sample rate used for pre-rendered tones (default: 44100)
         """
+        super().__init__()
         self.tone_duration_ms = tone_duration_ms
+        self.sample_rate = sample_rate
+
+        # Pre-render every symbol once as 16-bit PCM, indexed by nibble value
+        tones = np.stack(
+            [
+                generate_tone(
+                    self._symbol_to_frequencies(symbol),
+                    tone_duration_ms,
+                    sample_rate,
+                )
+                for symbol in DTMF_SYMBOLS
+            ]
+        )
+        self._pcm = to_pcm16(tones)
 
-    def _char_to_dtmf_symbols(self, char: str) -> list[str]:
-        """Convert a character to its DTMF symbol representation."""
-        # Get ASCII code and convert to 2-digit hex
-        ascii_code = ord(char)
-        hex_str = f"{ascii_code:02x}"
-
-        # Map each hex digit to DTMF symbol
-        return [HEX_TO_DTMF[digit] for digit in hex_str]
-
-    def _symbol_to_frequencies(self, symbol: str) -> list[float]:
+    def _symbol_to_frequencies(self, symbol: str) -> tuple[float, float]:
         """Get the frequency pair for a DTMF symbol."""
-        return [
-            float(LOW_FREQUENCIES[symbol]),
-            float(HIGH_FREQUENCIES[symbol]),
-        ]
+        return SYMBOL_FREQS[symbol]
 
-    def encode(self, text: str) -> EncodedFrame:
+    def _encode(self, text: str) -> EncodedFrame:
         """
         Encode text into DTMF tones.
 
@@ -120,18 +98,24 @@ class DTMFEncoder(BaseEncoder):
         Returns:
             EncodedFrame containing dual-tone events
         """
-        tones: list[ToneEvent] = []
-
-        for char in text:
-            symbols = self._char_to_dtmf_symbols(char)
-            for symbol in symbols:
-                frequencies = self._symbol_to_frequencies(symbol)
-                tones.append(
-                    ToneEvent(
-                        frequencies=frequencies,
-                        duration_ms=self.tone_duration_ms,
-                    )
-                )
+        freqs = NIBBLE_FREQS[_text_to_nibbles(text)]
+        durations_ms = uniform_durations(len(freqs), self.tone_duration_ms)
 
-        return EncodedFrame(tones=tones, original_text=text)
+        return EncodedFrame(
+            freqs=freqs,
+            durations_ms=durations_ms,
+            symbol_duration_ms=self.tone_duration_ms,
+            original_text=text,
+        )
 
+    def encode_pcm(self, text: str) -> np.ndarray:
+        """
+        Encode text directly into DTMF audio samples.
+
+        Args:
+            text: The text to encode
+
+        Returns:
+            Concatenated int16 samples for every tone in the text
+        """
+        return self._pcm[_text_to_nibbles(text)].ravel()
@@ -0,0 +1,101 @@
+"""Shared implementation for encoders that map each character to one tone."""
+
+import functools
+
+import numpy as np
+
+from ..audio.tone import generate_tone, to_pcm16
+from .base import BaseEncoder, EncodedFrame, text_to_codes, uniform_durations
+
+
+@functools.lru_cache(maxsize=None)
+def frequency_table(min_frequency: float, max_frequency: float) -> np.ndarray:
+    """
+    Frequency for every character code (0-255), as a read-only float32 array.
+
+    Uses linear interpolation:
+    frequency = MIN_FREQ + (ascii_code / 255) * RANGE
+    """
+    codes = np.arange(256, dtype=np.float64)
+    table = (min_frequency + codes / 255 * (max_frequency - min_frequency)).astype(
+        np.float32
+    )
+    table.flags.writeable = False
+    return table
+
+
+class SingleToneEncoder(BaseEncoder):
+    """
+    Base class for encoders that map each character code to one frequency.
+
+    Subclasses set ``min_frequency`` and ``max_frequency``. Encoding a text
+    is a single table gather over all of its character codes, for both the
+    frequency frame and the pre-rendered PCM.
+    """
+
+    min_frequency: float
+    max_frequency: float
+
+    def __init__(
+        self,
+        tone_duration_ms: int,
+        sample_rate: int = 44100,
+        prerender: bool = True,
+    ):
+        """
+        Initialize the encoder and pre-render its symbols.
+
+        Args:
+            tone_duration_ms: Duration of each tone in milliseconds
+            sample_rate: Sample rate used for pre-rendered tones (default: 44100)
+            prerender: Pre-render the symbol table used by encode_pcm;
+                subclasses that synthesize differently can skip it (default: True)
+        """
+        super().__init__()
+        self.tone_duration_ms = tone_duration_ms
+        self.sample_rate = sample_rate
+        self._freq_lut = frequency_table(self.min_frequency, self.max_frequency)
+        self._pcm: np.ndarray | None = None
+        if not prerender:
+            return
+
+        # Pre-render all 256 symbols as 16-bit PCM, indexed by character code
+        tones = np.stack(
+            [
+                generate_tone([frequency], tone_duration_ms, sample_rate)
+                for frequency in self._freq_lut.tolist()
+            ]
+        )
+        self._pcm = to_pcm16(tones)
+
+    def _encode(self, text: str) -> EncodedFrame:
+        """
+        Encode text into single-frequency tones, one per character.
+
+        Args:
+            text: The text to encode
+
+        Returns:
+            EncodedFrame containing single-tone events
+        """
+        freqs = self._freq_lut[text_to_codes(text)][:, None]
+        durations_ms = uniform_durations(len(freqs), self.tone_duration_ms)
+
+        return EncodedFrame(
+            freqs=freqs,
+            durations_ms=durations_ms,
+            symbol_duration_ms=self.tone_duration_ms,
+            original_text=text,
+        )
+
+    def encode_pcm(self, text: str) -> np.ndarray:
+        """
+        Encode text directly into audio samples.
+
+        Args:
+            text: The text to encode
+
+        Returns:
+            Concatenated int16 samples for every tone in the text
+        """
+        return self._pcm[text_to_codes(text)].ravel()
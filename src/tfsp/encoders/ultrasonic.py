@@ -9,18 +9,27 @@ With 5ms tones and 256 frequencies, this can achieve ~1.6 KB/sec
 which is 100-1000x faster than TTS.
 """
 
-from .base import BaseEncoder, EncodedFrame, ToneEvent
+import numpy as np
+
+from ..audio.tone import synthesize_frame, to_pcm16
+from .base import EncodedFrame, text_to_codes, uniform_durations
+from .single_tone import SingleToneEncoder, frequency_table
 
 # Ultrasonic frequency range (mostly inaudible to humans)
 MIN_FREQUENCY = 15000.0  # 15 kHz - edge of human hearing
 MAX_FREQUENCY = 20000.0  # 20 kHz - upper limit of most audio hardware
 FREQUENCY_RANGE = MAX_FREQUENCY - MIN_FREQUENCY
 
+# Disjoint sub-bands used when packing two bytes into one dual-tone symbol,
+# with a 20 Hz guard gap between them (~9.8 Hz spacing within each band)
+LOW_BAND = (15000.0, 17490.0)  # First byte of each pair
+HIGH_BAND = (17510.0, 20000.0)  # Second byte of each pair
+
 # Default tone duration - much shorter than audible encoders
 DEFAULT_TONE_DURATION_MS = 5  # 5ms per symbol = 200 symbols/sec
 
 
-class UltrasonicEncoder(BaseEncoder):
+class UltrasonicEncoder(SingleToneEncoder):
     """
     High-speed ultrasonic encoder for AI-to-AI communication.
 
@@ -28,61 +37,116 @@ class UltrasonicEncoder(BaseEncoder):
     With 5ms tones, achieves ~1600 bits/sec (200 bytes/sec).
 
     Inaudible to most humans but perfectly decodable by machines.
+    Adjacent frequencies are ~19.6 Hz apart, easily distinguishable.
+
+    With bytes_per_symbol=2, each symbol instead carries two bytes as two
+    simultaneous tones, one per sub-band (like DTMF's dual tones), halving
+    the number of symbols for the same text.
     """
 
-    def __init__(self, tone_duration_ms: int = DEFAULT_TONE_DURATION_MS):
+    min_frequency = MIN_FREQUENCY
+    max_frequency = MAX_FREQUENCY
+
+    def __init__(
+        self,
+        tone_duration_ms: int = DEFAULT_TONE_DURATION_MS,
+        sample_rate: int = 44100,
+        collapse_runs: bool = False,
+        bytes_per_symbol: int = 1,
+    ):
         """
         Initialize ultrasonic encoder.
 
         Args:
             tone_duration_ms: Duration of each tone in milliseconds (default: 5ms)
+            sample_rate: Sample rate used for pre-rendered tones (default: 44100)
+            collapse_runs: Merge runs of repeated symbols into one longer
+                tone (default: False)
+            bytes_per_symbol: Bytes carried by each symbol, 1 (single tone
+                over the full band) or 2 (one tone per sub-band) (default: 1)
+
+        Raises:
+            ValueError: If bytes_per_symbol is not 1 or 2
         """
-        self.tone_duration_ms = tone_duration_ms
-
-    def _char_to_frequency(self, char: str) -> float:
-        """
-        Map a character to its corresponding ultrasonic frequency.
-
-        Uses linear interpolation across 256 values in 15-20kHz range.
-        Each frequency is ~19.6 Hz apart, easily distinguishable.
-        """
-        ascii_code = ord(char)
-        ascii_code = max(0, min(255, ascii_code))
-
-        frequency = MIN_FREQUENCY + (ascii_code / 255) * FREQUENCY_RANGE
-        return frequency
-
-    def encode(self, text: str) -> EncodedFrame:
+        if bytes_per_symbol not in (1, 2):
+            raise ValueError(f"bytes_per_symbol must be 1 or 2, got {bytes_per_symbol}")
+        # Dual-tone symbols are always synthesized per frame
+        super().__init__(tone_duration_ms, sample_rate, prerender=bytes_per_symbol == 1)
+        self.collapse_runs = collapse_runs
+        self.bytes_per_symbol = bytes_per_symbol
+        if bytes_per_symbol == 1:
+            self._band_luts = (self._freq_lut,)
+        else:
+            self._band_luts = (frequency_table(*LOW_BAND), frequency_table(*HIGH_BAND))
+
+    def _encode(self, text: str) -> EncodedFrame:
         """
         Encode text into ultrasonic tones.
 
-        Each character becomes a single high-frequency tone.
+        Each character becomes a single high-frequency tone, or with
+        bytes_per_symbol=2 each pair of characters becomes one dual tone
+        (an odd trailing character is paired with code 0).
         At 5ms per tone, a 100-char message takes only 500ms.
 
+        With collapse_runs enabled, a run of N repeated symbols becomes
+        one tone lasting N * tone_duration_ms.
+
         Args:
             text: The text to encode
 
         Returns:
             EncodedFrame containing ultrasonic tone events
         """
-        tones: list[ToneEvent] = []
-
-        for char in text:
-            frequency = self._char_to_frequency(char)
-            tones.append(
-                ToneEvent(
-                    frequencies=[frequency],
-                    duration_ms=self.tone_duration_ms,
-                )
-            )
+        codes = text_to_codes(text)
+        if len(codes) % self.bytes_per_symbol:
+            codes = np.r_[codes, np.zeros(1, dtype=np.uint8)]
+        # One row of character codes per symbol
+        symbols = codes.reshape(-1, self.bytes_per_symbol)
+
+        if self.collapse_runs and len(symbols) > 0:
+            changed = (symbols[1:] != symbols[:-1]).any(axis=1)
+            starts = np.flatnonzero(np.r_[True, changed])
+            run_lengths = np.diff(np.r_[starts, len(symbols)])
+            symbols = symbols[starts]
+            durations_ms = run_lengths * self.tone_duration_ms
+        else:
+            durations_ms = uniform_durations(len(symbols), self.tone_duration_ms)
+
+        freqs = np.empty(symbols.shape, dtype=np.float32)
+        for band, lut in enumerate(self._band_luts):
+            freqs[:, band] = lut[symbols[:, band]]
+
+        return EncodedFrame(
+            freqs=freqs,
+            durations_ms=durations_ms,
+            symbol_duration_ms=self.tone_duration_ms,
+            original_text=text,
+        )
+
+    def encode_pcm(self, text: str) -> np.ndarray:
+        """
+        Encode text directly into ultrasonic audio samples.
 
-        return EncodedFrame(tones=tones, original_text=text)
+        Args:
+            text: The text to encode
+
+        Returns:
+            Concatenated int16 samples for every tone in the text
+        """
+        if self.collapse_runs or self.bytes_per_symbol > 1:
+            # Runs have variable length and byte pairs have 65536 possible
+            # symbols, so neither can come from the pre-rendered table
+            frame = self.encode(text)
+            return to_pcm16(
+                synthesize_frame(frame.freqs, frame.durations_ms, self.sample_rate)
+            )
+        return super().encode_pcm(text)
 
     @property
     def theoretical_speed_bps(self) -> float:
         """Calculate theoretical bits per second."""
         symbols_per_sec = 1000 / self.tone_duration_ms
-        bits_per_symbol = 8  # Full byte per symbol
+        bits_per_symbol = 8 * self.bytes_per_symbol  # Full bytes per symbol
         return symbols_per_sec * bits_per_symbol
 
     @property
@@ -6,6 +6,9 @@ from anthropic import AsyncAnthropic
 
 from .base import BaseProvider
 
+# Stream event type that carries generated text
+_CONTENT_DELTA = "content_block_delta"
+
 
 class AnthropicProvider(BaseProvider):
     """Anthropic streaming provider using the official SDK."""
@@ -21,7 +24,7 @@ class AnthropicProvider(BaseProvider):
         self.client = AsyncAnthropic(api_key=api_key)
         self.model = model
 
-    async def stream(self, prompt: str) -> AsyncGenerator[str, None]:
+    async def _stream(self, prompt: str) -> AsyncGenerator[str, None]:
         """
         Stream response tokens from Anthropic.
 
@@ -39,6 +42,9 @@ class AnthropicProvider(BaseProvider):
         )
 
         async for event in stream:
-            if event.type == "content_block_delta" and hasattr(event.delta, "text"):
-                yield event.delta.text
+            if event.type == _CONTENT_DELTA:
+                # Non-text deltas (e.g. tool input JSON) have no text attribute
+                text = getattr(event.delta, "text", None)
+                if text:
+                    yield text
 
@@ -1,24 +1,67 @@
 """Base class for LLM providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+
+# Maximum number of chunks read ahead of the consumer
+PREFETCH_CHUNKS = 32
+
+# Marks the end of a prefetched stream
+_STREAM_END = object()
 
 
 class BaseProvider(ABC):
     """Base class for LLM providers."""
 
-    @abstractmethod
     async def stream(self, prompt: str) -> AsyncGenerator[str, None]:
         """
         Stream response tokens from the LLM.
 
+        The network stream is read on a background task into a bounded
+        queue, so the provider keeps receiving tokens while the caller is
+        still encoding and playing earlier ones.
+
         Args:
             prompt: The prompt to send to the LLM
 
         Yields:
-            str: Text chunks as they arrive (may be partial tokens)
+            str: Non-empty text chunks as they arrive (may be partial tokens)
         """
-        # Abstract async generator - yield for type checker
-        yield ""
-        raise NotImplementedError
+        queue: asyncio.Queue = asyncio.Queue(maxsize=PREFETCH_CHUNKS)
+        producer = asyncio.create_task(self._prefetch(prompt, queue))
+        try:
+            while (item := await queue.get()) is not _STREAM_END:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Stop reading the network if the caller stops early
+            producer.cancel()
+
+    async def _prefetch(self, prompt: str, queue: asyncio.Queue) -> None:
+        """Read every chunk into a queue, followed by _STREAM_END or the error."""
+        try:
+            async for chunk in self._stream(prompt):
+                # Drop empty chunks here so consumers never have to check for them
+                if chunk:
+                    await queue.put(chunk)
+        except Exception as error:
+            await queue.put(error)
+        else:
+            await queue.put(_STREAM_END)
 
+    @abstractmethod
+    def _stream(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream response tokens straight from the LLM's API.
+
+        Subclasses implement this as an async generator.
+
+        Args:
+            prompt: The prompt to send to the LLM
+
+        Returns:
+            Async iterator over text chunks as they arrive
+        """
+        raise NotImplementedError
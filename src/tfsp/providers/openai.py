@@ -21,7 +21,7 @@ class OpenAIProvider(BaseProvider):
         self.client = AsyncOpenAI(api_key=api_key)
         self.model = model
 
-    async def stream(self, prompt: str) -> AsyncGenerator[str, None]:
+    async def _stream(self, prompt: str) -> AsyncGenerator[str, None]:
         """
         Stream response tokens from OpenAI.
 
@@ -38,6 +38,11 @@ class OpenAIProvider(BaseProvider):
         )
 
         async for chunk in stream:
-            if chunk.choices and chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+            # The final usage chunk has no choices; role-only deltas have no content
+            choices = chunk.choices
+            if not choices:
+                continue
+            content = choices[0].delta.content
+            if content:
+                yield content
 
@@ -0,0 +1,25 @@
+"""Event loop selection for the streaming pipeline."""
+
+import asyncio
+from collections.abc import Callable
+
+try:
+    import uvloop
+except ImportError:  # uvloop not installed
+    uvloop = None
+
+
+def fast_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """
+    Event loop factory to pass to ``asyncio.run``.
+
+    uvloop is optional: it cuts the per-event overhead of the providers'
+    SSE streams, and when it is not installed (or on Windows, where it is
+    unavailable) None is returned so asyncio uses its default loop.
+
+    Returns:
+        uvloop's loop constructor, or None for the default loop
+    """
+    if uvloop is None:
+        return None
+    return uvloop.new_event_loop
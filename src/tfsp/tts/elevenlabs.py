@@ -1,12 +1,19 @@
 """ElevenLabs TTS implementation for baseline comparison."""
 
+import asyncio
+import hashlib
 import io
+import tempfile
 import time
 from dataclasses import dataclass
+from pathlib import Path
 
-from elevenlabs import ElevenLabs
+from elevenlabs import AsyncElevenLabs, ElevenLabs
 from elevenlabs.play import play
 
+# Maximum number of requests synthesize_many keeps in flight
+MAX_CONCURRENT_REQUESTS = 8
+
 
 @dataclass
 class TTSResult:
@@ -33,6 +40,7 @@ class ElevenLabsTTS:
         api_key: str | None = None,
         voice_id: str = "JBFqnCBsd6RMkjVDRZzb",  # George
         model_id: str = "eleven_multilingual_v2",
+        cache_dir: str | Path | None = None,
     ):
         """
         Initialize ElevenLabs TTS.
@@ -41,10 +49,66 @@ class ElevenLabsTTS:
             api_key: ElevenLabs API key (if None, uses ELEVENLABS_API_KEY env var)
             voice_id: Voice ID to use
             model_id: Model ID to use
+            cache_dir: Directory to cache synthesized audio in (default: no cache)
         """
         self.client = ElevenLabs(api_key=api_key)
+        self.async_client = AsyncElevenLabs(api_key=api_key)
         self.voice_id = voice_id
         self.model_id = model_id
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _cache_path(self, text: str) -> Path | None:
+        """Cache file for text with the current voice and model, if caching."""
+        if self.cache_dir is None:
+            return None
+        key = f"{self.voice_id}:{self.model_id}:{text}".encode()
+        return self.cache_dir / f"{hashlib.blake2b(key, digest_size=16).hexdigest()}.mp3"
+
+    def _store(self, cache_path: Path | None, audio_data: bytes) -> None:
+        """Write synthesized audio to the cache, if caching."""
+        if cache_path is None:
+            return
+        # Write to a temp file unique to this writer, then rename, so an
+        # interrupted run never leaves a truncated file behind as a cache
+        # hit and concurrent writers of the same key never collide
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, suffix=".tmp", delete=False
+        ) as tmp_file:
+            tmp_file.write(audio_data)
+        Path(tmp_file.name).replace(cache_path)
+
+    def _load(self, cache_path: Path | None) -> bytes | None:
+        """Read cached audio, or None on a miss or when not caching."""
+        if cache_path is None:
+            return None
+        try:
+            return cache_path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _convert_kwargs(self, text: str) -> dict[str, str]:
+        """Arguments for the text_to_speech.convert call on either client."""
+        return {
+            "text": text,
+            "voice_id": self.voice_id,
+            "model_id": self.model_id,
+            "output_format": "mp3_44100_128",
+        }
+
+    def _result(self, text: str, audio_data: bytes, start_ns: int) -> TTSResult:
+        """Build the result for text synthesized since start_ns."""
+        # Integer nanoseconds, converted once, so no precision is lost
+        # subtracting two large float timestamps
+        synthesis_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+        return TTSResult(
+            audio_data=audio_data,
+            text=text,
+            synthesis_time_ms=synthesis_time_ms,
+            char_count=len(text),
+        )
 
     def synthesize(self, text: str) -> TTSResult:
         """
@@ -56,27 +120,72 @@ class ElevenLabsTTS:
         Returns:
             TTSResult with audio data and timing info
         """
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
+
+        cache_path = self._cache_path(text)
+        audio_data = self._load(cache_path)
+        if audio_data is None:
+            # Append chunks as they arrive instead of holding them all in a
+            # list until the end
+            buf = io.BytesIO()
+            audio_generator = self.client.text_to_speech.convert(
+                **self._convert_kwargs(text)
+            )
+            for chunk in audio_generator:
+                buf.write(chunk)
+            audio_data = buf.getvalue()
+            self._store(cache_path, audio_data)
+
+        return self._result(text, audio_data, start_ns)
+
+    async def synthesize_async(self, text: str) -> TTSResult:
+        """
+        Synthesize text to speech without blocking the event loop.
 
-        audio_generator = self.client.text_to_speech.convert(
-            text=text,
-            voice_id=self.voice_id,
-            model_id=self.model_id,
-            output_format="mp3_44100_128",
-        )
+        Cache reads and writes run on a worker thread.
+
+        Args:
+            text: Text to synthesize
+
+        Returns:
+            TTSResult with audio data and timing info
+        """
+        start_ns = time.perf_counter_ns()
+
+        cache_path = self._cache_path(text)
+        audio_data = await asyncio.to_thread(self._load, cache_path)
+        if audio_data is None:
+            buf = io.BytesIO()
+            audio_stream = self.async_client.text_to_speech.convert(
+                **self._convert_kwargs(text)
+            )
+            async for chunk in audio_stream:
+                buf.write(chunk)
+            audio_data = buf.getvalue()
+            await asyncio.to_thread(self._store, cache_path, audio_data)
+
+        return self._result(text, audio_data, start_ns)
+
+    async def synthesize_many(self, texts: list[str]) -> list[TTSResult]:
+        """
+        Synthesize several texts concurrently.
 
-        # Collect all audio chunks
-        audio_data = b"".join(audio_generator)
+        At most MAX_CONCURRENT_REQUESTS requests are in flight at once, so
+        batches overlap network round-trips without tripping rate limits.
 
-        end_time = time.perf_counter()
-        synthesis_time_ms = (end_time - start_time) * 1000
+        Args:
+            texts: Texts to synthesize
 
-        return TTSResult(
-            audio_data=audio_data,
-            text=text,
-            synthesis_time_ms=synthesis_time_ms,
-            char_count=len(text),
-        )
+        Returns:
+            TTSResult for each text, in the same order as ``texts``
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def synthesize_one(text: str) -> TTSResult:
+            async with semaphore:
+                return await self.synthesize_async(text)
+
+        return list(await asyncio.gather(*(synthesize_one(text) for text in texts)))
 
     def synthesize_and_play(self, text: str) -> TTSResult:
         """
@@ -89,7 +198,8 @@ class ElevenLabsTTS:
             TTSResult with timing info
         """
         result = self.synthesize(text)
-        # Play the audio
-        play(io.BytesIO(result.audio_data))
+        # Play the bytes directly; play() would otherwise split a file
+        # object into lines and join them back into a second copy
+        play(result.audio_data)
         return result
 
@@ -1,6 +1,6 @@
 import numpy as np
 
-from src.tfsp.audio import generate_tone
+from src.tfsp.audio import generate_tone, synthesize_frame, to_pcm16, tone
 
 
 class TestToneGeneration:
@@ -46,6 +46,15 @@ class TestToneGeneration:
         expected_samples = int(22050 * 0.1)
         assert len(samples) == expected_samples
 
+    def test_sample_spacing_matches_sample_rate(self):
+        """Test that samples are spaced exactly 1/sample_rate apart."""
+        # 5ms is shorter than the fade window, so no envelope is applied
+        samples = generate_tone([11025.0], duration_ms=5, sample_rate=44100)
+
+        # A quarter-sample-rate tone cycles through 0, 1, 0, -1
+        expected = np.tile([0.0, 1.0, 0.0, -1.0], len(samples) // 4)
+        np.testing.assert_allclose(samples, expected, atol=1e-3)
+
     def test_empty_frequencies(self):
         """Test with empty frequency list."""
         samples = generate_tone([], duration_ms=100, sample_rate=44100)
@@ -53,3 +62,59 @@ class TestToneGeneration:
         # Should return zeros
         assert np.all(samples == 0)
 
+
+class TestPCM16:
+    """Tests for 16-bit PCM quantization."""
+
+    def test_full_scale(self):
+        """Test that -1 and 1 map to the int16 full-scale values."""
+        pcm = to_pcm16(np.array([-1.0, 0.0, 1.0], dtype=np.float32))
+        assert pcm.dtype == np.int16
+        assert pcm.tolist() == [-32767, 0, 32767]
+
+    def test_out_of_range_clips(self):
+        """Test that out-of-range samples clip instead of wrapping."""
+        pcm = to_pcm16(np.array([1.5, -1.5], dtype=np.float32))
+        assert pcm.tolist() == [32767, -32767]
+
+
+class TestFrameSynthesis:
+    """Tests for whole-frame synthesis."""
+
+    def test_matches_generate_tone(self):
+        """Test that frame synthesis matches per-tone generation."""
+        freqs = np.array([[697.0, 1209.0], [440.0, np.nan]], dtype=np.float32)
+        durations_ms = np.array([50, 30])
+
+        samples = synthesize_frame(freqs, durations_ms, sample_rate=44100)
+
+        expected = np.concatenate(
+            [
+                generate_tone([697.0, 1209.0], duration_ms=50, sample_rate=44100),
+                generate_tone([440.0], duration_ms=30, sample_rate=44100),
+            ]
+        )
+        assert samples.dtype == np.float32
+        np.testing.assert_allclose(samples, expected, atol=1e-4)
+
+    def test_numpy_fallback_matches_generate_tone(self, monkeypatch):
+        """Test the NumPy path used when numba is not installed."""
+        monkeypatch.setattr(tone, "_numba_synthesize_frame", lambda: None)
+        freqs = np.array([[697.0, 1209.0], [440.0, np.nan]], dtype=np.float32)
+        durations_ms = np.array([50, 30])
+
+        samples = synthesize_frame(freqs, durations_ms, sample_rate=44100)
+
+        expected = np.concatenate(
+            [
+                generate_tone([697.0, 1209.0], duration_ms=50, sample_rate=44100),
+                generate_tone([440.0], duration_ms=30, sample_rate=44100),
+            ]
+        )
+        np.testing.assert_array_equal(samples, expected)
+
+    def test_empty_frame(self):
+        """Test synthesizing a frame with no tones."""
+        freqs = np.zeros((0, 1), dtype=np.float32)
+
+        assert len(synthesize_frame(freqs, np.zeros(0, dtype=np.int64))) == 0
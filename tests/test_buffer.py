@@ -0,0 +1,35 @@
+import asyncio
+
+from src.tfsp.buffer import TokenBuffer
+
+
+class TestTokenBuffer:
+    """Tests for token buffering."""
+
+    def test_flush_at_threshold(self):
+        """Test that buffer flushes joined text once threshold is reached."""
+        flushed: list[str] = []
+
+        async def on_flush(text: str) -> None:
+            flushed.append(text)
+
+        async def run() -> None:
+            buffer = TokenBuffer(3, on_flush)
+            for chunk in ["Hel", "lo", " wor", "ld"]:
+                await buffer.add(chunk)
+            await buffer.flush()
+
+        asyncio.run(run())
+
+        assert flushed == ["Hello wor", "ld"]
+
+    def test_flush_empty_buffer(self):
+        """Test that flushing an empty buffer does not invoke the callback."""
+        flushed: list[str] = []
+
+        async def on_flush(text: str) -> None:
+            flushed.append(text)
+
+        asyncio.run(TokenBuffer(1, on_flush).flush())
+
+        assert flushed == []
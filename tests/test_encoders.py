@@ -1,4 +1,14 @@
-from src.tfsp.encoders import DTMFEncoder, FSKEncoder, UltrasonicEncoder
+import dataclasses
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.tfsp.audio import generate_tone, to_pcm16
+from src.tfsp.encoders import DTMFEncoder, EncodedFrame, FSKEncoder, UltrasonicEncoder
+from src.tfsp.encoders.base import text_to_codes
 
 
 class TestDTMFEncoder:
@@ -43,6 +53,15 @@ class TestDTMFEncoder:
         for tone in frame.tones:
             assert tone.duration_ms == 50
 
+    def test_encode_non_ascii(self):
+        """Test that non-ASCII characters use their clamped character code."""
+        encoder = DTMFEncoder(tone_duration_ms=100)
+
+        # 'é' is 0xE9 = 2 hex digits = 2 tones, same as FSK/Ultrasonic codes
+        assert len(encoder.encode("é").tones) == 2
+        # '€' (U+20AC) clamps to 0xFF, still 2 tones
+        assert len(encoder.encode("€").tones) == 2
+
 
 class TestFSKEncoder:
     """Tests for FSK encoder."""
@@ -139,6 +158,16 @@ class TestUltrasonicEncoder:
         for tone in frame.tones:
             assert tone.duration_ms == 1
 
+    def test_collapse_runs(self):
+        """Test that repeated characters merge into one longer tone."""
+        encoder = UltrasonicEncoder(tone_duration_ms=5, collapse_runs=True)
+        frame = encoder.encode("Hello")
+
+        # 'll' collapses into a single 10ms tone
+        assert [t.duration_ms for t in frame.tones] == [5, 5, 10, 5]
+        assert frame.symbol_duration_ms == 5
+        assert len(encoder.encode_pcm("Hello")) == 3 * int(44100 * 0.005) + int(44100 * 0.01)
+
     def test_theoretical_speed(self):
         """Test theoretical speed calculation."""
         encoder = UltrasonicEncoder(tone_duration_ms=5)
@@ -153,3 +182,183 @@ class TestUltrasonicEncoder:
 
         # At 1ms per symbol = 1000 symbols/sec * 8 bits = 8000 bps
         assert encoder.theoretical_speed_bps == 8000
+
+    def test_two_bytes_per_symbol(self):
+        """Test that pairs of characters become one dual tone."""
+        encoder = UltrasonicEncoder(tone_duration_ms=5, bytes_per_symbol=2)
+        frame = encoder.encode("Hi!")
+
+        # "Hi" and "!" padded with code 0
+        assert len(frame.tones) == 2
+        for tone in frame.tones:
+            low, high = tone.frequencies
+            assert 15000 <= low <= 17490
+            assert 17510 <= high <= 20000
+        assert frame.tones[1].frequencies[1] == 17510
+        assert len(encoder.encode_pcm("Hi!")) == 2 * int(44100 * 0.005)
+
+    def test_two_bytes_per_symbol_skips_prerender(self):
+        """Test that dual-tone mode does not pre-render the unused table."""
+        assert UltrasonicEncoder(bytes_per_symbol=2)._pcm is None
+        assert UltrasonicEncoder(bytes_per_symbol=1)._pcm is not None
+
+    def test_two_bytes_per_symbol_speed(self):
+        """Test that packing two bytes per symbol doubles the bit rate."""
+        encoder = UltrasonicEncoder(tone_duration_ms=5, bytes_per_symbol=2)
+        assert encoder.theoretical_speed_bps == 3200
+
+    def test_invalid_bytes_per_symbol(self):
+        """Test that unsupported symbol sizes are rejected."""
+        with pytest.raises(ValueError):
+            UltrasonicEncoder(bytes_per_symbol=3)
+
+    def test_tones_materialized_once(self):
+        """Test that the ToneEvent list is built lazily and then reused."""
+        frame = UltrasonicEncoder(tone_duration_ms=5).encode("Hello")
+
+        assert frame.tones is frame.tones
+
+    def test_tone_frequencies_are_float32_arrays(self):
+        """Test that materialized tones hold float32 arrays, not lists."""
+        frame = DTMFEncoder(tone_duration_ms=100).encode("A")
+
+        for tone in frame.tones:
+            assert isinstance(tone.frequencies, np.ndarray)
+            assert tone.frequencies.dtype == np.float32
+
+
+class TestEncodeCache:
+    """Tests for per-encoder frame caching."""
+
+    def test_repeated_text_reuses_frame(self):
+        """Test that encoding the same text twice returns the cached frame."""
+        encoder = FSKEncoder(tone_duration_ms=100)
+
+        assert encoder.encode("the ") is encoder.encode("the ")
+
+    def test_cached_frame_is_read_only(self):
+        """Test that shared frames cannot be mutated by callers."""
+        frame = UltrasonicEncoder(tone_duration_ms=5).encode("A")
+
+        assert not frame.freqs.flags.writeable
+        assert not frame.durations_ms.flags.writeable
+
+
+class TestEncodePCM:
+    """Tests for pre-rendered PCM encoding."""
+
+    def test_dtmf_pcm_length(self):
+        """Test DTMF PCM has two tones worth of samples per character."""
+        encoder = DTMFEncoder(tone_duration_ms=100, sample_rate=44100)
+        samples = encoder.encode_pcm("Hi")
+
+        assert samples.dtype == np.int16
+        assert len(samples) == 4 * int(44100 * 0.1)
+
+    def test_fsk_pcm_matches_generate_tone(self):
+        """Test FSK PCM matches tones generated on the fly."""
+        encoder = FSKEncoder(tone_duration_ms=50)
+        frame = encoder.encode("AB")
+
+        expected = np.concatenate(
+            [generate_tone(t.frequencies, t.duration_ms, 44100) for t in frame.tones]
+        )
+        np.testing.assert_array_equal(encoder.encode_pcm("AB"), to_pcm16(expected))
+
+    def test_ultrasonic_pcm_length(self):
+        """Test ultrasonic PCM has one tone worth of samples per character."""
+        encoder = UltrasonicEncoder(tone_duration_ms=5)
+        samples = encoder.encode_pcm("Hello")
+
+        assert len(samples) == 5 * int(44100 * 0.005)
+
+    def test_empty_text(self):
+        """Test encoding empty text returns no samples."""
+        for encoder in (DTMFEncoder(), FSKEncoder(), UltrasonicEncoder()):
+            assert len(encoder.encode_pcm("")) == 0
+
+
+class TestEncodedFrame:
+    """Tests for the columnar encoded frame."""
+
+    def test_columns_match_tones(self):
+        """Test that frequency/duration columns line up with tone count."""
+        frame = DTMFEncoder(tone_duration_ms=40).encode("Hi")
+
+        assert frame.freqs.shape == (4, 2)
+        assert frame.durations_ms.sum() == 4 * 40
+
+    def test_uniform_durations_share_storage(self):
+        """Test uniform frames store their duration once."""
+        frame = FSKEncoder(tone_duration_ms=40).encode("abcd")
+        assert frame.durations_ms.tolist() == [40, 40, 40, 40]
+        assert frame.durations_ms.strides == (0,)
+
+    def test_frame_and_tones_are_frozen(self):
+        """Test that shared frames and their tones cannot be reassigned."""
+        frame = DTMFEncoder().encode("A")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            frame.original_text = "B"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            frame.tones[0].duration_ms = 1
+        assert not hasattr(frame.tones[0], "__dict__")
+
+    def test_tones_compare_by_identity(self):
+        """Test that dual-tone events can be compared and hashed."""
+        first = DTMFEncoder().encode("A").tones[0]
+        second = DTMFEncoder().encode("A").tones[0]
+        assert first == first
+        assert first != second
+        assert len({first, second}) == 2
+
+    def test_tones_drop_nan_padding(self):
+        """Test that NaN-padded voices are dropped when materializing tones."""
+        frame = EncodedFrame(
+            freqs=np.array([[440.0, np.nan], [697.0, 1209.0]], dtype=np.float32),
+            durations_ms=np.array([10, 20]),
+            symbol_duration_ms=10,
+            original_text="",
+        )
+
+        assert [t.frequencies.tolist() for t in frame.tones] == [[440.0], [697.0, 1209.0]]
+        assert [t.duration_ms for t in frame.tones] == [10, 20]
+
+
+class TestTextToCodes:
+    """Tests for text to character code conversion."""
+
+    def test_codes_are_uint8(self):
+        """Test codes are narrowed to one byte per character."""
+        codes = text_to_codes("Hi!")
+        assert codes.dtype == np.uint8
+        assert codes.tolist() == [72, 105, 33]
+
+    def test_codes_clamped(self):
+        """Test characters above 255 clamp to 255."""
+        assert text_to_codes("a\u00e9\u20ac").tolist() == [97, 233, 255]
+
+    def test_lone_surrogate(self):
+        """Test that a lone surrogate clamps instead of failing to encode."""
+        assert text_to_codes("a\ud800b").tolist() == [97, 255, 98]
+        assert len(DTMFEncoder().encode("a\ud800b").tones) == 6
+
+    def test_ascii_fast_path_matches_general_path(self):
+        """Test ASCII text gets the same codes as the clamping path."""
+        text = "Hello, world!"
+        general = text_to_codes(text + "\u00e9")[:-1]
+        assert text_to_codes(text).tolist() == general.tolist()
+
+
+class TestEncoderImports:
+    """Tests for the encoders' import-time dependencies."""
+
+    def test_import_without_playback_backend(self):
+        """Test that encoders import without sounddevice or numba."""
+        code = (
+            "import sys\n"
+            "sys.modules['sounddevice'] = None\n"
+            "import src.tfsp.encoders\n"
+            "assert 'numba' not in sys.modules\n"
+        )
+        repo_root = Path(__file__).resolve().parent.parent
+        subprocess.run([sys.executable, "-c", code], cwd=repo_root, check=True)
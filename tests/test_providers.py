@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from src.tfsp.providers import AnthropicProvider, BaseProvider, OpenAIProvider
@@ -11,6 +13,46 @@ class TestBaseProvider:
         with pytest.raises(TypeError):
             BaseProvider()
 
+    def test_stream_prefetches_all_chunks(self):
+        """Test that stream yields every chunk of _stream in order."""
+
+        class FakeProvider(BaseProvider):
+            async def _stream(self, prompt):
+                for chunk in prompt.split():
+                    yield chunk
+
+        async def collect() -> list[str]:
+            return [chunk async for chunk in FakeProvider().stream("a b c")]
+
+        assert asyncio.run(collect()) == ["a", "b", "c"]
+
+    def test_stream_drops_empty_chunks(self):
+        """Test that empty chunks from the API never reach the consumer."""
+
+        class SparseProvider(BaseProvider):
+            async def _stream(self, prompt):
+                for chunk in ["", "a", "", "b"]:
+                    yield chunk
+
+        async def collect() -> list[str]:
+            return [chunk async for chunk in SparseProvider().stream("")]
+
+        assert asyncio.run(collect()) == ["a", "b"]
+
+    def test_stream_reraises_errors(self):
+        """Test that an error while streaming reaches the consumer."""
+
+        class FailingProvider(BaseProvider):
+            async def _stream(self, prompt):
+                yield "partial"
+                raise ConnectionError("dropped")
+
+        async def collect() -> list[str]:
+            return [chunk async for chunk in FailingProvider().stream("")]
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(collect())
+
 
 class TestOpenAIProvider:
     """Tests for OpenAI provider."""
@@ -0,0 +1,88 @@
+import asyncio
+
+from src.tfsp.tts import ElevenLabsTTS
+from src.tfsp.tts.elevenlabs import MAX_CONCURRENT_REQUESTS
+
+
+class TestElevenLabsCache:
+    """Tests for the ElevenLabs on-disk audio cache."""
+
+    def test_cache_hit_skips_api(self, tmp_path):
+        """Test that cached audio is returned without calling the API."""
+        tts = ElevenLabsTTS(api_key="test-key", cache_dir=tmp_path)
+        tts._cache_path("Hello").write_bytes(b"cached-mp3")
+
+        def fail(**kwargs):
+            raise AssertionError("API should not be called on a cache hit")
+
+        tts.client.text_to_speech.convert = fail
+        result = tts.synthesize("Hello")
+        assert result.audio_data == b"cached-mp3"
+        assert result.char_count == 5
+
+    def test_cache_miss_stores_audio(self, tmp_path):
+        """Test that synthesized audio is written to the cache."""
+        tts = ElevenLabsTTS(api_key="test-key", cache_dir=tmp_path)
+        tts.client.text_to_speech.convert = lambda **kwargs: iter([b"ab", b"cd"])
+
+        tts.synthesize("Hello")
+        assert tts._cache_path("Hello").read_bytes() == b"abcd"
+
+    def test_store_uses_unique_temp_file(self, tmp_path):
+        """Test that writers never share a temp file for the same key."""
+        tts = ElevenLabsTTS(api_key="test-key", cache_dir=tmp_path)
+        path = tts._cache_path("Hello")
+        # Another process mid-write of the same key
+        other_tmp = path.with_suffix(".tmp")
+        other_tmp.write_bytes(b"other")
+
+        tts._store(path, b"audio")
+
+        assert path.read_bytes() == b"audio"
+        assert other_tmp.read_bytes() == b"other"
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_cache_key_includes_voice(self, tmp_path):
+        """Test that different voices do not share cache entries."""
+        first = ElevenLabsTTS(api_key="test-key", voice_id="a", cache_dir=tmp_path)
+        second = ElevenLabsTTS(api_key="test-key", voice_id="b", cache_dir=tmp_path)
+        assert first._cache_path("Hello") != second._cache_path("Hello")
+
+
+class TestElevenLabsBatch:
+    """Tests for concurrent batch synthesis."""
+
+    def test_synthesize_many_preserves_order(self):
+        """Test that results come back in the order texts were given."""
+        tts = ElevenLabsTTS(api_key="test-key")
+        in_flight = 0
+        peak = 0
+
+        async def convert(text, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001 * (len(text) % 3))
+            in_flight -= 1
+            yield text.encode()
+
+        tts.async_client.text_to_speech.convert = convert
+        texts = [f"text {i}" for i in range(20)]
+        results = asyncio.run(tts.synthesize_many(texts))
+
+        assert [result.audio_data for result in results] == [t.encode() for t in texts]
+        assert peak <= MAX_CONCURRENT_REQUESTS
+
+    def test_synthesize_many_uses_cache(self, tmp_path):
+        """Test that batch synthesis reads and fills the shared cache."""
+        tts = ElevenLabsTTS(api_key="test-key", cache_dir=tmp_path)
+        tts._cache_path("cached").write_bytes(b"from-disk")
+
+        async def convert(text, **kwargs):
+            yield b"from-api"
+
+        tts.async_client.text_to_speech.convert = convert
+        results = asyncio.run(tts.synthesize_many(["cached", "fresh"]))
+
+        assert [result.audio_data for result in results] == [b"from-disk", b"from-api"]
+        assert tts._cache_path("fresh").read_bytes() == b"from-api"
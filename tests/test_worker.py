@@ -0,0 +1,54 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.tfsp.audio import PlayerWorker
+
+
+class StubPlayer:
+    """Records what the worker does with the player."""
+
+    def __init__(self, fail_on: int | None = None):
+        self.calls: list[tuple] = []
+        self.fail_on = fail_on
+
+    def play(self, samples: np.ndarray, blocking: bool = True) -> None:
+        if len(samples) == self.fail_on:
+            raise RuntimeError("device lost")
+        self.calls.append(("play", len(samples), blocking))
+
+    def wait(self) -> None:
+        self.calls.append(("wait",))
+
+
+class TestPlayerWorker:
+    """Tests for the background playback worker."""
+
+    def test_submit_drain_close_order(self):
+        """Test that buffers play in order, then drain waits for the player."""
+        player = StubPlayer()
+        worker = PlayerWorker(player)
+        worker.submit(np.zeros(3, dtype=np.int16))
+        worker.submit(np.zeros(5, dtype=np.int16))
+
+        asyncio.run(worker.drain())
+        worker.close()
+
+        assert player.calls == [("play", 3, False), ("play", 5, False), ("wait",)]
+        assert not worker._thread.is_alive()
+
+    def test_play_error_raised_from_drain(self):
+        """Test that a playback error surfaces from drain instead of hanging."""
+        player = StubPlayer(fail_on=2)
+        worker = PlayerWorker(player)
+        worker.submit(np.zeros(2, dtype=np.int16))
+        worker.submit(np.zeros(4, dtype=np.int16))
+
+        with pytest.raises(RuntimeError, match="device lost"):
+            asyncio.run(worker.drain())
+
+        # Later buffers still play, and the error is reported only once
+        asyncio.run(worker.drain())
+        worker.close()
+        assert player.calls == [("play", 4, False), ("wait",)]